@@ -1,249 +1,454 @@
-import json
+import hashlib
+import heapq
+import itertools
 import os
+import string
 import time
 import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Dict, Any
-import pdfplumber
+from typing import List, Dict, Any, Optional
+import ahocorasick
+import fitz
+import joblib
+import numba
+import orjson
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.preprocessing import normalize
 import numpy as np
 
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def _score_sections(section_mat, query_vec, boosts):
+    """Fused cosine similarity + boost addition over dense float32 rows"""
+    n_rows, n_cols = section_mat.shape
+    scores = np.empty(n_rows, dtype=np.float32)
+    query_norm = np.sqrt((query_vec * query_vec).sum())
+    for i in numba.prange(n_rows):
+        dot = np.float32(0.0)
+        norm = np.float32(0.0)
+        for j in range(n_cols):
+            value = section_mat[i, j]
+            dot += value * query_vec[j]
+            norm += value * value
+        denom = np.sqrt(norm) * query_norm
+        scores[i] = (dot / denom if denom > 0 else np.float32(0.0)) + boosts[i]
+    return scores
+
+# Maps punctuation to spaces so lowered section text tokenizes cleanly on
+# word boundaries; computed once instead of per section
+_LOWER_TABLE = str.maketrans(string.punctuation, ' ' * len(string.punctuation))
+
+# Sentence delimiter for refinement, compiled once
+_SENT_RE = re.compile(r'[.!?]+')
+
+_TRAVEL_BOOST_TERMS = ['restaurant', 'hotel', 'attraction', 'activity', 'food', 'culture', 'history', 'city', 'place', 'visit', 'trip', 'travel']
+_GROUP_BOOST_TERMS = ['group', 'friends', 'college', 'young', 'budget', 'affordable', 'student']
+_BOOST_TERM_WEIGHTS = ([(term, 0.1) for term in _TRAVEL_BOOST_TERMS]
+                       + [(term, 0.05) for term in _GROUP_BOOST_TERMS])
+
+# Fitted vectorizers are persisted here, keyed by corpus hash, so repeated
+# CLI runs over the same document set skip the vocabulary+IDF pass
+_VECTORIZER_CACHE_DIR = '.vectorizer_cache'
+
+# Section-header heuristics merged into one alternation so each page is
+# scanned once instead of once per pattern
+_SECTION_RE = re.compile(
+    r'(?:^|\n)(?P<caps>[A-Z][A-Z\s]{2,50})\n'  # ALL CAPS headers
+    r'|(?:^|\n)(?P<num>\d+\.?\s+[A-Z][^.!?]*)\n'  # Numbered sections
+    r'|(?:^|\n)(?P<kw>Abstract|Introduction|Methods?|Results?|Discussion|Conclusion|References|Background|Related Work|Experiments?)[.\s]*\n'
+    r'|(?:^|\n)(?P<roman>[IVX]+\.\s+[A-Z][^.!?]*)\n',  # Roman numerals
+    re.IGNORECASE | re.MULTILINE
+)
+
+# The same four heuristics as separate expressions for hyperscan, whose
+# block-mode DFA scans large pages without backtracking. Keep in sync with
+# _SECTION_RE above.
+_SECTION_PATTERN_STRINGS = (
+    r'(?:^|\n)[A-Z][A-Z\s]{2,50}\n',
+    r'(?:^|\n)\d+\.?\s+[A-Z][^.!?]*\n',
+    r'(?:^|\n)(?:Abstract|Introduction|Methods?|Results?|Discussion|Conclusion|References|Background|Related Work|Experiments?)[.\s]*\n',
+    r'(?:^|\n)[IVX]+\.\s+[A-Z][^.!?]*\n',
+)
+
+_HS_DB = None
+if hyperscan is not None:
+    try:
+        _HS_DB = hyperscan.Database()
+        _HS_DB.compile(
+            expressions=[p.encode() for p in _SECTION_PATTERN_STRINGS],
+            ids=list(range(len(_SECTION_PATTERN_STRINGS))),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_MULTILINE
+                   | hyperscan.HS_FLAG_SINGLEMATCH] * len(_SECTION_PATTERN_STRINGS),
+        )
+    except hyperscan.error:
+        _HS_DB = None
+
+@dataclass
+class SectionStore:
+    """Column-wise (struct-of-arrays) storage for extracted sections.
+
+    Keeping each field in its own parallel column lets ranking work on
+    NumPy score/rank arrays directly instead of reading and writing dict
+    entries per section; rows are only materialized as dicts when the JSON
+    output is built.
+    """
+    docs: List[str] = field(default_factory=list)
+    pages: List[int] = field(default_factory=list)
+    titles: List[str] = field(default_factory=list)
+    titles_lower: List[str] = field(default_factory=list)
+    texts: List[str] = field(default_factory=list)
+    texts_lower: List[str] = field(default_factory=list)
+    scores: Optional[np.ndarray] = None
+    ranks: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def append(self, document: str, page: int, title: str, text: str) -> None:
+        self.docs.append(document)
+        self.pages.append(page)
+        self.titles.append(title)
+        self.titles_lower.append(title.lower())
+        self.texts.append(text)
+        self.texts_lower.append(text.translate(_LOWER_TABLE).lower())
+
+    def extend(self, other: 'SectionStore') -> None:
+        self.docs.extend(other.docs)
+        self.pages.extend(other.pages)
+        self.titles.extend(other.titles)
+        self.titles_lower.extend(other.titles_lower)
+        self.texts.extend(other.texts)
+        self.texts_lower.extend(other.texts_lower)
+
+    def select(self, indices: np.ndarray) -> 'SectionStore':
+        """New store with the given rows; ranks are renumbered 1..k in order"""
+        selected = SectionStore(
+            docs=[self.docs[i] for i in indices],
+            pages=[self.pages[i] for i in indices],
+            titles=[self.titles[i] for i in indices],
+            titles_lower=[self.titles_lower[i] for i in indices],
+            texts=[self.texts[i] for i in indices],
+            texts_lower=[self.texts_lower[i] for i in indices],
+        )
+        if self.scores is not None:
+            selected.scores = self.scores[indices]
+        selected.ranks = np.arange(1, len(selected) + 1)
+        return selected
+
+def _page_has_headers(text: str) -> bool:
+    """Cheap DFA prefilter: can this page contain any section header at all?
+
+    Hyperscan reports every possible match end rather than re's
+    leftmost-longest spans, so it cannot produce the boundaries directly;
+    instead it rules pages out in one zero-backtrack pass, and only pages
+    with a hit pay for the exact re scan.
+    """
+    hits = []
+
+    def on_match(pattern_id, start, end, flags, context):
+        context.append(pattern_id)
+        return 1  # first hit is enough; stop scanning
+
+    try:
+        _HS_DB.scan(text.encode('latin-1', 'replace'),
+                    match_event_handler=on_match, context=hits)
+    except hyperscan.ScanTerminated:
+        pass
+    return bool(hits)
+
+def _find_boundaries(text: str) -> List[tuple]:
+    """Locate section-header boundaries as ordered (position, title) pairs"""
+    if _HS_DB is not None and not _page_has_headers(text):
+        return []
+
+    # Single pass; finditer on the merged pattern yields matches already in
+    # position order, so no sort (or per-pattern heap merge) is needed
+    boundaries = []
+    for match in _SECTION_RE.finditer(text):
+        title = next(g for g in match.groups() if g)
+        # Headers (notably ALL CAPS ones) may span lines; store them flat
+        boundaries.append((match.start(), re.sub(r'\s+', ' ', title).strip()))
+    return boundaries
+
+def extract_text_from_pdf(pdf_path: str) -> SectionStore:
+    """Extract text from PDF with page and section information.
+
+    Module-level (not a method) so it pickles cleanly into worker processes.
+    """
+    store = SectionStore()
+    document = os.path.basename(pdf_path)
+
+    try:
+        doc = fitz.open(pdf_path)
+        try:
+            for page_num, page in enumerate(doc, 1):
+                # A page without a content stream cannot carry text; skip it
+                # before paying for full text extraction
+                if not page.get_contents():
+                    continue
+                text = page.get_text("text")
+                if text and len(text.strip()) > 50:  # Filter out empty/short pages
+                    _split_into_sections(store, document, text, page_num)
+        finally:
+            doc.close()
+    except Exception as e:
+        print(f"Error processing {pdf_path}: {str(e)}")
+
+    return store
+
+def _split_into_sections(store: SectionStore, document: str, text: str, page_num: int) -> None:
+    """Split page text into logical sections, appending columns to the store"""
+
+    # Measure the raw page before normalization: short or newline-poor pages
+    # cannot contain the newline-anchored headers, so skip the scan for them
+    if len(text) < 500 or text.count('\n') < 3:
+        _split_by_paragraphs(store, document, text, page_num)
+        return
+
+    # Collapse runs of spaces and tabs but keep line breaks; every header
+    # pattern anchors on a trailing newline
+    text = re.sub(r'[ \t]+', ' ', text).strip()
+
+
+    boundaries = _find_boundaries(text)
+
+    if not boundaries:
+        # Fallback: split by paragraphs
+        _split_by_paragraphs(store, document, text, page_num)
+        return
+
+
+    added = 0
+    current_section = "Introduction"
+    start_pos = 0
+
+    for pos, title in boundaries:
+        # Add previous section
+        if start_pos < pos:
+            section_text = re.sub(r'\s+', ' ', text[start_pos:pos]).strip()
+            if len(section_text) > 100:  # Minimum section length
+                store.append(document, page_num, current_section, section_text)
+                added += 1
+
+        current_section = title
+        start_pos = pos
+
+
+    final_text = re.sub(r'\s+', ' ', text[start_pos:]).strip()
+    if len(final_text) > 100:
+        store.append(document, page_num, current_section, final_text)
+        added += 1
+
+    if not added:
+        _split_by_paragraphs(store, document, text, page_num)
+
+def _split_by_paragraphs(store: SectionStore, document: str, text: str, page_num: int) -> None:
+    """Fallback method: split by paragraphs"""
+    paragraphs = [p.strip() for p in text.split('\n\n') if len(p.strip()) > 100]
+
+    for i, para in enumerate(paragraphs[:5]):  # Limit to 5 paragraphs per page
+        store.append(document, page_num, f"Section {i+1}", re.sub(r'\s+', ' ', para))
+
 class DocumentIntelligenceSystem:
     def __init__(self):
         """Initialize with TF-IDF vectorizer for CPU-only processing"""
+        # min_df=2 drops hapax n-grams (their IDF is saturated anyway) and
+        # trigrams add vocabulary bulk without improving ranking; float32
+        # halves memory bandwidth in the similarity matmul
         self.vectorizer = TfidfVectorizer(
             max_features=5000,
             stop_words='english',
-            ngram_range=(1, 3),
-            min_df=1,
-            max_df=0.95
+            ngram_range=(1, 2),
+            min_df=2,
+            max_df=0.95,
+            dtype=np.float32,
+            sublinear_tf=True,
+            # Section text is lowered once at extraction time, so the
+            # vectorizer's own lowercasing pass is redundant
+            lowercase=False
         )
-        
-    def extract_text_from_pdf(self, pdf_path: str) -> List[Dict]:
-        """Extract text from PDF with page and section information"""
-        sections = []
-        
-        try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    text = page.extract_text()
-                    if text and len(text.strip()) > 50:  # Filter out empty/short pages
-                        section_splits = self._split_into_sections(text, page_num)
-                        for section in section_splits:
-                            section['document'] = os.path.basename(pdf_path)
-                        sections.extend(section_splits)
-        except Exception as e:
-            print(f"Error processing {pdf_path}: {str(e)}")
-                    
-        return sections
-    
-    def _split_into_sections(self, text: str, page_num: int) -> List[Dict]:
-        """Split text into logical sections using multiple strategies"""
-        sections = []
-        
-        
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        
-        section_patterns = [
-            r'(?:^|\n)([A-Z][A-Z\s]{2,50})\n',  # ALL CAPS headers
-            r'(?:^|\n)(\d+\.?\s+[A-Z][^.!?]*)\n',  # Numbered sections
-            r'(?:^|\n)(Abstract|Introduction|Methods?|Results?|Discussion|Conclusion|References|Background|Related Work|Experiments?)[.\s]*\n',
-            r'(?:^|\n)([IVX]+\.\s+[A-Z][^.!?]*)\n'  # Roman numerals
-        ]
-        
-        
-        boundaries = []
-        for pattern in section_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE))
-            for match in matches:
-                boundaries.append((match.start(), match.group(1).strip()))
-        
-        
-        boundaries.sort(key=lambda x: x[0])
-        
-        if not boundaries:
-            # Fallback: split by paragraphs
-            return self._split_by_paragraphs(text, page_num)
-        
-        
-        current_section = "Introduction"
-        start_pos = 0
-        
-        for i, (pos, title) in enumerate(boundaries):
-            # Add previous section
-            if start_pos < pos:
-                section_text = text[start_pos:pos].strip()
-                if len(section_text) > 100:  # Minimum section length
-                    sections.append({
-                        'document': 'placeholder',
-                        'page_number': page_num,
-                        'section_title': current_section,
-                        'text': section_text
-                    })
-            
-            current_section = title
-            start_pos = pos
-        
-        
-        final_text = text[start_pos:].strip()
-        if len(final_text) > 100:
-            sections.append({
-                'document': 'placeholder',
-                'page_number': page_num,
-                'section_title': current_section,
-                'text': final_text
-            })
-            
-        return sections if sections else self._split_by_paragraphs(text, page_num)
-    
-    def _split_by_paragraphs(self, text: str, page_num: int) -> List[Dict]:
-        """Fallback method: split by paragraphs"""
-        paragraphs = [p.strip() for p in text.split('\n\n') if len(p.strip()) > 100]
-        
-        sections = []
-        for i, para in enumerate(paragraphs[:5]):  # Limit to 5 paragraphs per page
-            sections.append({
-                'document': 'placeholder',
-                'page_number': page_num,
-                'section_title': f"Section {i+1}",
-                'text': para
-            })
-        
-        return sections
-    
-    def rank_sections_by_relevance(self, sections: List[Dict], 
-                                 persona: Dict, job_description: str) -> List[Dict]:
+        self._fitted_key = None
+
+        # Aho-Corasick automaton finds every boost term in one linear pass
+        # per section instead of one substring scan per term
+        self._boost_automaton = ahocorasick.Automaton()
+        for index, (term, weight) in enumerate(_BOOST_TERM_WEIGHTS):
+            self._boost_automaton.add_word(term, (index, weight))
+        self._boost_automaton.make_automaton()
+
+    def _fit_or_load_vectorizer(self, section_texts: List[str]) -> None:
+        """Fit the vectorizer once per document set.
+
+        IDF is a corpus statistic, so refitting on every ranking call wastes
+        the expensive vocabulary+IDF pass. The fit is keyed by a content hash
+        of the section texts and reused from memory or disk when the same
+        corpus comes around again.
+        """
+        digest = hashlib.sha1()
+        for text in section_texts:
+            digest.update(text.encode('utf-8', 'replace'))
+            digest.update(b'\x00')
+        corpus_key = digest.hexdigest()
+
+        if self._fitted_key == corpus_key:
+            return
+
+        cache_path = os.path.join(_VECTORIZER_CACHE_DIR, f'tfidf_{corpus_key}.joblib')
+        if os.path.exists(cache_path):
+            self.vectorizer = joblib.load(cache_path)
+        else:
+            self.vectorizer.fit(section_texts)
+            os.makedirs(_VECTORIZER_CACHE_DIR, exist_ok=True)
+            joblib.dump(self.vectorizer, cache_path)
+        self._fitted_key = corpus_key
+
+    def rank_sections_by_relevance(self, store: SectionStore,
+                                 persona: Dict, job_description: str) -> SectionStore:
         """Rank sections based on persona and job relevance"""
-        
-        if not sections:
-            return []
-        
-        
+
+        if not len(store):
+            # Select zero rows so scores/ranks are (empty) arrays rather than
+            # None; downstream zips over the columns rely on that
+            store.scores = np.zeros(0)
+            return store.select(np.arange(0))
+
+
         persona_role = persona.get('role', '')
         persona_expertise = persona.get('expertise', '')
         persona_focus = ' '.join(persona.get('focus_areas', []))
-        
-        
+
+
         if 'travel' in persona_role.lower() or 'planner' in persona_role.lower():
             travel_keywords = ['itinerary', 'activities', 'attractions', 'restaurants', 'hotels', 'transportation', 'budget', 'schedule']
             persona_expertise += ' ' + ' '.join(travel_keywords)
-        
+
         persona_text = f"{persona_role} {persona_expertise} {persona_focus}"
         query = f"{persona_text} {job_description}"
-        
-        
-        section_texts = [s['text'] for s in sections]
-        all_texts = section_texts + [query]
-        
+
+
+        section_texts = store.texts_lower
+
         try:
-            # Fit TF-IDF and transform
-            tfidf_matrix = self.vectorizer.fit_transform(all_texts)
-            
-            
+            # Fit TF-IDF (cached per corpus) and transform; the vectorizer
+            # consumes an iterator, so the query is chained onto the section
+            # texts without copying them into a combined list
+            self._fit_or_load_vectorizer(section_texts)
+            tfidf_matrix = self.vectorizer.transform(
+                itertools.chain(section_texts, (query.lower(),)))
+
+            # L2-normalize once so cosine similarity reduces to a dot product
+            tfidf_matrix = normalize(tfidf_matrix, norm='l2', copy=False)
+
             query_vector = tfidf_matrix[-1]
             section_vectors = tfidf_matrix[:-1]
-            
-            
-            similarities = cosine_similarity(query_vector, section_vectors)[0]
-            
-            
-            travel_boost_terms = ['restaurant', 'hotel', 'attraction', 'activity', 'food', 'culture', 'history', 'city', 'place', 'visit', 'trip', 'travel']
-            group_boost_terms = ['group', 'friends', 'college', 'young', 'budget', 'affordable', 'student']
-            
-            for i, section in enumerate(sections):
-                base_score = similarities[i]
-                
-                
-                boost = 0
-                section_lower = section['text'].lower()
-                
-                
-                for term in travel_boost_terms:
-                    if term in section_lower:
-                        boost += 0.1
-                
-                
-                for term in group_boost_terms:
-                    if term in section_lower:
-                        boost += 0.05
-                
-                
-                title_lower = section['section_title'].lower()
-                if any(term in title_lower for term in ['restaurant', 'hotel', 'activity', 'attraction', 'thing to do', 'tip']):
-                    boost += 0.2
-                
-                final_score = base_score + boost
-                section['relevance_score'] = float(final_score)
-                section['importance_rank'] = 0  # Will be set after sorting
-            
-            
-            sections.sort(key=lambda x: x['relevance_score'], reverse=True)
-            
-            
-            for i, section in enumerate(sections):
-                section['importance_rank'] = i + 1
-                
+
+
+            # One automaton pass per section finds every boost term at once,
+            # counting each term at most once; this also restores substring
+            # matching (plural and inflected forms) that the vocabulary
+            # column lookup missed
+            boosts = np.zeros(len(store), dtype=np.float32)
+            for i, text_lower in enumerate(store.texts_lower):
+                seen = set()
+                total = 0.0
+                for _, (term_id, weight) in self._boost_automaton.iter(text_lower):
+                    if term_id not in seen:
+                        seen.add(term_id)
+                        total += weight
+                boosts[i] = total
+
+            title_boost_terms = ['restaurant', 'hotel', 'activity', 'attraction', 'thing to do', 'tip']
+            title_boosts = np.fromiter(
+                (0.2 if any(t in title for t in title_boost_terms) else 0.0
+                 for title in store.titles_lower),
+                dtype=np.float32, count=len(store))
+
+            combined_boosts = boosts + title_boosts
+
+            # Dense rows only pay off when the matrix is reasonably full;
+            # otherwise stick to the sparse cosine path
+            n_rows, n_features = section_vectors.shape
+            density = section_vectors.nnz / (n_rows * n_features)
+            if density > 0.05:
+                final_scores = _score_sections(
+                    section_vectors.toarray().astype(np.float32),
+                    np.asarray(query_vector.todense(), dtype=np.float32).ravel(),
+                    combined_boosts)
+            else:
+                similarities = np.asarray((section_vectors @ query_vector.T).todense()).ravel()
+                final_scores = similarities + combined_boosts
+
+            store.scores = final_scores.astype(np.float64)
+
+            # O(N) partition for the top k, then sort only those k rows
+            k = min(15, len(store))
+            top_idx = np.argpartition(-store.scores, k - 1)[:k]
+            top_idx = top_idx[np.argsort(-store.scores[top_idx], kind='stable')]
+            return store.select(top_idx)
+
         except Exception as e:
             print(f"Error in ranking: {str(e)}")
             # Fallback: assign sequential ranks
-            for i, section in enumerate(sections):
-                section['relevance_score'] = 1.0 / (i + 1)
-                section['importance_rank'] = i + 1
-        
-        return sections[:15]  
-    
-    def refine_sections(self, sections: List[Dict], job_description: str) -> List[Dict]:
+            store.scores = 1.0 / (np.arange(len(store)) + 1)
+            return store.select(np.arange(min(15, len(store))))
+
+    def refine_sections(self, store: SectionStore, job_description: str) -> List[Dict]:
         """Refine sections for sub-section analysis"""
         refined_sections = []
-        
-        
-        job_terms = set(re.findall(r'\b[a-zA-Z]{4,}\b', job_description.lower()))
-        
-        for section in sections:
-            sentences = [s.strip() for s in re.split(r'[.!?]+', section['text']) if len(s.strip()) > 20]
-            
-            
+
+
+        job_terms = frozenset(re.findall(r'\b[a-zA-Z]{4,}\b', job_description.lower()))
+
+        for i, text in enumerate(store.texts):
+            # One compiled split, one strip and one length check per sentence
+            sentences = [s for s in map(str.strip, _SENT_RE.split(text)) if len(s) > 20]
+
+
+            # Tokenize once per sentence and intersect word sets instead of
+            # scanning the sentence for every job term
             scored_sentences = []
             for sentence in sentences:
-                sentence_lower = sentence.lower()
-                score = sum(1 for term in job_terms if term in sentence_lower)
+                words = set(re.findall(r'\b[a-z]{4,}\b', sentence.lower()))
+                score = len(words & job_terms)
                 scored_sentences.append((score, sentence))
-            
-            
-            scored_sentences.sort(key=lambda x: x[0], reverse=True)
-            top_sentences = [s[1] for s in scored_sentences[:3]]
-            
+
+
+            top_sentences = [s[1] for s in heapq.nlargest(3, scored_sentences, key=lambda x: x[0])]
+
             if not top_sentences and sentences:
                 top_sentences = sentences[:2]  # Fallback to first sentences
-            
+
             refined_text = '. '.join(top_sentences)
             if not refined_text.endswith('.'):
                 refined_text += '.'
-            
+
             refined_sections.append({
-                'document': section['document'],
-                'page_number': section['page_number'],
-                'section_title': section['section_title'],
+                'document': store.docs[i],
+                'page_number': store.pages[i],
+                'section_title': store.titles[i],
                 'refined_text': refined_text,
-                'importance_rank': section['importance_rank']
+                'importance_rank': int(store.ranks[i])
             })
-        
+
         return refined_sections
-    
+
     def process_documents(self, config_path: str) -> Dict[str, Any]:
         """Main processing function"""
         start_time = time.time()
-        
+
         try:
-            
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            
+
+            with open(config_path, 'rb') as f:
+                config = orjson.loads(f.read())
+
             print("Configuration loaded successfully")
-            
-            
+
+
             if 'challenge_info' in config:
                 # New format with challenge_info
                 documents = config['documents']
@@ -256,33 +461,44 @@ class DocumentIntelligenceSystem:
                 persona = config['persona']
                 job_description = config['job_to_be_done']
                 challenge_info = {}
-            
-            
-            all_sections = []
-            processed_docs = []
-            
+
+
+            existing_paths = []
             for doc_path in documents:
                 if os.path.exists(doc_path):
-                    print(f"Processing {doc_path}...")
-                    sections = self.extract_text_from_pdf(doc_path)
-                    all_sections.extend(sections)
-                    processed_docs.append(os.path.basename(doc_path))
+                    existing_paths.append(doc_path)
                 else:
                     print(f"Warning: Document not found: {doc_path}")
-            
+
+            processed_docs = [os.path.basename(p) for p in existing_paths]
+
+
+            all_sections = SectionStore()
+            if existing_paths:
+                print(f"Processing {len(existing_paths)} documents in parallel...")
+                # One worker process per PDF (capped at CPU count); only the path
+                # string crosses the process boundary, never document objects.
+                max_workers = min(os.cpu_count() or 1, len(existing_paths))
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    # executor.map yields per-document stores as they finish;
+                    # each is merged and released instead of holding every
+                    # document's results alive at once
+                    for doc_store in executor.map(extract_text_from_pdf, existing_paths):
+                        all_sections.extend(doc_store)
+
             print(f"Extracted {len(all_sections)} sections from {len(processed_docs)} documents")
-            
-            
+
+
             ranked_sections = self.rank_sections_by_relevance(
                 all_sections, persona, job_description
             )
-            
+
             print(f"Ranked {len(ranked_sections)} sections")
-            
-            
+
+
             refined_sections = self.refine_sections(ranked_sections, job_description)
-            
-            
+
+
             output = {
                 "metadata": {
                     "input_documents": processed_docs,
@@ -293,22 +509,24 @@ class DocumentIntelligenceSystem:
                 },
                 "extracted_sections": [
                     {
-                        "document": section['document'],
-                        "page_number": section['page_number'],
-                        "section_title": section['section_title'],
-                        "importance_rank": section['importance_rank']
+                        "document": document,
+                        "page_number": page,
+                        "section_title": title,
+                        "importance_rank": int(rank)
                     }
-                    for section in ranked_sections
+                    for document, page, title, rank in zip(
+                        ranked_sections.docs, ranked_sections.pages,
+                        ranked_sections.titles, ranked_sections.ranks)
                 ],
                 "sub_section_analysis": refined_sections
             }
-            
-            
+
+
             if challenge_info:
                 output["metadata"]["challenge_info"] = challenge_info
-            
+
             return output
-            
+
         except Exception as e:
             print(f"Error in processing: {str(e)}")
             return {
@@ -327,14 +545,15 @@ class DocumentIntelligenceSystem:
 def main():
     """Main execution function"""
     print("=== Document Intelligence System Starting ===")
-    
+
     system = DocumentIntelligenceSystem()
     result = system.process_documents('input_config.json')
-    
-    
-    with open('challenge1b_output.json', 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
-    
+
+
+    # orjson writes UTF-8 directly (equivalent to ensure_ascii=False)
+    with open('challenge1b_output.json', 'wb') as f:
+        f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+
     print(f"\n=== Processing Complete ===")
     print(f"Processing time: {result['metadata']['processing_time_seconds']} seconds")
     print(f"Extracted sections: {len(result['extracted_sections'])}")